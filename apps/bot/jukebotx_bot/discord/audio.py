@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import re
 import subprocess
-import threading
-from typing import Optional
+from typing import IO, Optional
 
 import discord
 
@@ -14,15 +15,33 @@ from jukebotx_bot.discord.session import SessionState, Track
 
 logger = logging.getLogger(__name__)
 
+# Precompiled (like _URL_RE in suno.py): this check runs on every playback
+# start, and case-insensitive patterns avoid lowercasing the URL per call.
+_HTTP_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+_SUNO_PAGE_RE = re.compile(r"suno\.com/s(?:ong)?/", re.IGNORECASE)
+_AUDIO_URL_RE = re.compile(r"\.mp3(?:\?|$)|cdn", re.IGNORECASE)
+
+
+def _terminate_sync(process: subprocess.Popen) -> None:
+    """Terminate an ffmpeg process, escalating to kill. Blocking; run off-loop."""
+    try:
+        process.terminate()
+        process.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait(timeout=2)
+
 
 class GuildAudioController:
     def __init__(self, guild_id: int, session: SessionState) -> None:
         self.guild_id = guild_id
         self.session = session
         self._lock = asyncio.Lock()
-        self._current_source: Optional[discord.FFmpegPCMAudio] = None
-        self._stderr_thread: Optional[threading.Thread] = None
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._current_source: Optional[discord.FFmpegOpusAudio] = None
+        self._stderr_task: Optional[asyncio.Task[None]] = None
+        # Controllers are only built from command handlers, so the bot's loop
+        # is always running here; cache it for the playback-finished callback.
+        self._loop = asyncio.get_running_loop()
 
     async def play_next(self, voice_client: discord.VoiceClient) -> Track | None:
         async with self._lock:
@@ -34,25 +53,17 @@ class GuildAudioController:
                 return None
 
             try:
-                source = self._build_source(track.audio_url)
+                source = await self._build_source(track.audio_url)
             except ValueError as exc:
                 logger.error("Refusing to play invalid audio URL for guild %s: %s", self.guild_id, exc)
                 self.session.stop_playback()
                 return None
             self._current_source = source
 
-            if self._loop is None:
-                self._loop = asyncio.get_running_loop()
-
-            def _after_playback(error: Exception | None, *, current_source=source) -> None:
-                if self._loop is None:
-                    return
-                asyncio.run_coroutine_threadsafe(
-                    self._on_track_end(voice_client, current_source, error),
-                    self._loop,
-                )
-
-            voice_client.play(source, after=_after_playback)
+            voice_client.play(
+                source,
+                after=functools.partial(self._schedule_track_end, voice_client, source),
+            )
             return track
 
     async def stop(self, voice_client: discord.VoiceClient) -> None:
@@ -66,10 +77,22 @@ class GuildAudioController:
         await self.stop(voice_client)
         return await self.play_next(voice_client)
 
+    def _schedule_track_end(
+        self,
+        voice_client: discord.VoiceClient,
+        source: discord.FFmpegOpusAudio,
+        error: Exception | None,
+    ) -> None:
+        """Hop from discord.py's player thread back onto the bot's event loop."""
+        asyncio.run_coroutine_threadsafe(
+            self._on_track_end(voice_client, source, error),
+            self._loop,
+        )
+
     async def _on_track_end(
         self,
         voice_client: discord.VoiceClient,
-        source: discord.FFmpegPCMAudio,
+        source: discord.FFmpegOpusAudio,
         error: Exception | None,
     ) -> None:
         if error is not None:
@@ -122,11 +145,18 @@ class GuildAudioController:
         embed = build_now_playing_embed(track)
         await channel.send(embed=embed)
 
-    def _build_source(self, url: str) -> discord.FFmpegPCMAudio:
+    async def _build_source(self, url: str) -> discord.FFmpegOpusAudio:
         self._assert_audio_url(url)
-        source = discord.FFmpegPCMAudio(
+        # Opus encoding happens inside ffmpeg (or is a straight copy when the
+        # source is already Opus), so discord.py ships frames without running
+        # libopus per 20 ms packet.
+        source = await discord.FFmpegOpusAudio.from_probe(
             url,
-            before_options="-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5",
+            method="fallback",
+            before_options=(
+                "-nostdin -hide_banner -loglevel error -nostats "
+                "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
+            ),
             options="-vn",
             stderr=subprocess.PIPE,
         )
@@ -134,35 +164,41 @@ class GuildAudioController:
         return source
 
     def _assert_audio_url(self, url: str) -> None:
-        lowered = url.lower()
-        if not lowered.startswith("http"):
+        if _HTTP_URL_RE.match(url) is None:
             raise ValueError(f"Audio URL must be http(s): {url}")
-        if "suno.com/song/" in lowered or "suno.com/s/" in lowered:
+        if _SUNO_PAGE_RE.search(url) is not None:
             raise ValueError(f"Refusing to pass Suno page URL to ffmpeg: {url}")
-        if not (lowered.endswith(".mp3") or "cdn" in lowered):
+        if _AUDIO_URL_RE.search(url) is None:
             raise ValueError(f"Refusing to pass non-audio URL to ffmpeg: {url}")
 
-    def _start_ffmpeg_logger(self, source: discord.FFmpegPCMAudio) -> None:
+    def _start_ffmpeg_logger(self, source: discord.FFmpegOpusAudio) -> None:
         process = getattr(source, "process", None)
         if process is None or process.stderr is None:
             return
+        self._stderr_task = asyncio.create_task(self._drain_stderr(process.stderr))
 
-        def _read_stderr() -> None:
-            for raw_line in iter(process.stderr.readline, b""):
-                if not raw_line:
-                    break
+    async def _drain_stderr(self, stderr: IO[bytes]) -> None:
+        """Log ffmpeg stderr lines cooperatively on the event loop."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        protocol = asyncio.StreamReaderProtocol(reader)
+        try:
+            transport, _ = await loop.connect_read_pipe(lambda: protocol, stderr)
+        except (OSError, ValueError):  # pragma: no cover - not a real pipe
+            return
+        try:
+            async for raw_line in reader:
                 line = raw_line.decode(errors="replace").rstrip()
                 if line:
                     logger.warning("FFmpeg stderr [guild=%s]: %s", self.guild_id, line)
-
-        self._stderr_thread = threading.Thread(
-            target=_read_stderr,
-            name=f"ffmpeg-stderr-{self.guild_id}",
-            daemon=True,
-        )
-        self._stderr_thread.start()
+        finally:
+            transport.close()
 
     async def _cleanup_ffmpeg(self) -> None:
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+
         source = self._current_source
         if source is None:
             return
@@ -176,11 +212,9 @@ class GuildAudioController:
                 logger.warning("Failed to close ffmpeg stdin: %s", exc)
 
             try:
-                process.terminate()
-                process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait(timeout=2)
+                # process.wait blocks; run it in a worker thread so a slow
+                # ffmpeg teardown never stalls packet sending for other guilds.
+                await asyncio.to_thread(_terminate_sync, process)
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("Failed to terminate ffmpeg process: %s", exc)
 
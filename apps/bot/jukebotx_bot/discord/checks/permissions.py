@@ -1,6 +1,7 @@
 # apps/bot/jukebotx_bot/discord/checks/permissions.py
 from __future__ import annotations
 
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -10,6 +11,10 @@ from discord.ext import commands
 # A callable you provide that returns allowed role IDs for a given guild_id.
 AllowedRoleIdsProvider = Callable[[int], Awaitable[set[int]]]
 
+# How long a guild's allowed-role set is reused before re-asking the provider.
+# Role config changes rarely; checks run on every gated command.
+_ALLOWED_ROLES_TTL_SECONDS = 30.0
+
 
 def _is_guild_admin(member: discord.Member) -> bool:
     """
@@ -42,6 +47,18 @@ def has_allowed_roles(
         A predicate suitable for discord.ext.commands.check(...)
     """
 
+    # guild_id -> (expires_at, allowed role ids). Scoped to this check so
+    # different providers never share entries.
+    cache: dict[int, tuple[float, frozenset[int]]] = {}
+
+    async def _allowed_for_guild(guild_id: int) -> frozenset[int]:
+        entry = cache.get(guild_id)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        allowed = frozenset(await allowed_role_ids_provider(guild_id))
+        cache[guild_id] = (time.monotonic() + _ALLOWED_ROLES_TTL_SECONDS, allowed)
+        return allowed
+
     async def predicate(ctx: commands.Context[Any]) -> bool:
         if ctx.guild is None:
             return False  # no DMs
@@ -54,13 +71,13 @@ def has_allowed_roles(
         if allow_admin and _is_guild_admin(member):
             return True
 
-        allowed_role_ids = await allowed_role_ids_provider(ctx.guild.id)
+        allowed_role_ids = await _allowed_for_guild(ctx.guild.id)
         if not allowed_role_ids:
             # If not configured yet, fail closed.
             return False
 
-        member_role_ids = {role.id for role in member.roles}
-        return not member_role_ids.isdisjoint(allowed_role_ids)
+        # Short-circuit scan: no throwaway set of the member's role ids.
+        return any(role.id in allowed_role_ids for role in member.roles)
 
     return predicate
 
@@ -78,6 +95,11 @@ def has_any_role_ids(
         allow_admin: Whether guild admins bypass the role requirement.
     """
 
+    # role_ids is fixed for the lifetime of the check; iterate it as a tuple
+    # and probe member.get_role (a dict lookup) instead of building a set of
+    # the member's roles per invocation.
+    role_id_tuple = tuple(role_ids)
+
     async def predicate(ctx: commands.Context[Any]) -> bool:
         if ctx.guild is None:
             return False
@@ -89,7 +111,6 @@ def has_any_role_ids(
         if allow_admin and _is_guild_admin(member):
             return True
 
-        member_role_ids = {role.id for role in member.roles}
-        return not member_role_ids.isdisjoint(role_ids)
+        return any(member.get_role(role_id) is not None for role_id in role_id_tuple)
 
     return predicate
@@ -4,27 +4,36 @@ import discord
 
 from jukebotx_bot.discord.session import Track
 
+_COLOR = 0x1DB954
+_FALLBACK_TITLE = "🎵 Now Playing"
+_LINK_NAME = "🔗 Original Link"
+
 
 def build_now_playing_embed(track: Track) -> discord.Embed:
-    title = track.title or "🎵 Now Playing"
+    title = track.title or _FALLBACK_TITLE
     artist = track.artist_display or "Unknown Artist"
     media_url = track.media_url
     url = track.page_url or track.audio_url
 
-    embed = discord.Embed(
-        title=title or "🎵 Now Playing",
-        description=f"By **{artist}**",
-        color=0x1DB954,
-    )
+    # Build the payload dict directly so Embed.from_dict constructs the embed
+    # in one go instead of going through per-field setters.
+    data: dict = {
+        "type": "rich",
+        "title": title,
+        "description": f"By **{artist}**",
+        "color": _COLOR,
+    }
 
     if media_url:
-        embed.set_image(url=media_url)
+        data["image"] = {"url": media_url}
 
     if url:
-        embed.add_field(
-            name="🔗 Original Link",
-            value=f"[Listen on Suno]({url})",
-            inline=False,
-        )
-
-    return embed
+        data["fields"] = [
+            {
+                "name": _LINK_NAME,
+                "value": f"[Listen on Suno]({url})",
+                "inline": False,
+            }
+        ]
+
+    return discord.Embed.from_dict(data)
@@ -1,6 +1,7 @@
 # apps/bot/jukebotx_bot/discord/session.py
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 import time
 
@@ -25,7 +26,7 @@ class SessionState:
     autoplay_remaining: int | None = None
     dj_enabled: bool = False
     dj_remaining: int | None = None
-    queue: list[Track] = field(default_factory=list)
+    queue: deque[Track] = field(default_factory=deque)
     now_playing: Track | None = None
     now_playing_started_at: float | None = None
     now_playing_channel_id: int | None = None
@@ -78,7 +79,7 @@ class SessionState:
             self.stop_playback()
             return None
 
-        track = self.queue.pop(0)
+        track = self.queue.popleft()
         self.now_playing = track
         self.now_playing_started_at = time.monotonic()
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable
 from urllib.parse import urlparse
 
 _URL_RE = re.compile(r"https?://[^\s<>]+")
@@ -14,6 +13,10 @@ def _normalize_url(url: str) -> str:
 
 
 def _is_suno_url(url: str) -> bool:
+    # Cheap reject before the comparatively heavy urlparse: every accepted
+    # host contains "suno", and most URLs in chat are not Suno links.
+    if "suno" not in url:
+        return False
     try:
         parsed = urlparse(url)
     except ValueError:
@@ -25,18 +28,13 @@ def extract_suno_urls(message_content: str) -> list[str]:
     if not message_content:
         return []
 
-    matches = _URL_RE.findall(message_content)
-    return _dedupe_preserve_order(
-        _normalize_url(match) for match in matches if _is_suno_url(_normalize_url(match))
-    )
-
-
-def _dedupe_preserve_order(items: Iterable[str]) -> list[str]:
+    # Single pass: normalize each match once, filter, and dedupe inline.
     seen: set[str] = set()
     ordered: list[str] = []
-    for item in items:
-        if item in seen:
+    for match in _URL_RE.finditer(message_content):
+        url = _normalize_url(match.group(0))
+        if url in seen or not _is_suno_url(url):
             continue
-        seen.add(item)
-        ordered.append(item)
+        seen.add(url)
+        ordered.append(url)
     return ordered
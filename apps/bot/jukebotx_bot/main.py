@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import islice
 import logging
 from typing import Optional
 
@@ -28,6 +29,11 @@ def _is_mod(member: discord.Member) -> bool:
     return bool(perms.administrator or perms.manage_guild)
 
 
+def select_playback_url(*, suno_url: str, mp3_url: str | None) -> str:
+    """Pick the URL handed to playback: prefer the direct MP3, fall back to the Suno page URL."""
+    return mp3_url or suno_url
+
+
 @dataclass(frozen=True)
 class BotDeps:
     """
@@ -431,7 +437,7 @@ class JukeBot(commands.Bot):
 
             if session.queue:
                 lines.append("Up next:")
-                for idx, track in enumerate(session.queue[:5], start=1):
+                for idx, track in enumerate(islice(session.queue, 5), start=1):
                     lines.append(f"{idx}. {track.title} (requested by {track.requester_name})")
             else:
                 lines.append("Queue is empty.")
@@ -551,7 +557,8 @@ class JukeBot(commands.Bot):
                 await ctx.send("Invalid queue index.")
                 return
 
-            track = session.queue.pop(index - 1)
+            track = session.queue[index - 1]
+            del session.queue[index - 1]
             await ctx.send(f"Removed: {track.title} (requested by {track.requester_name}).")
 
         @self.command(name="limit")
@@ -85,6 +85,13 @@ class TrackRepository:
     async def get_by_suno_url(self, suno_url: str) -> Track | None:
         raise NotImplementedError
 
+    async def get_by_ids(self, track_ids: list[UUID]) -> dict[UUID, Track]:
+        """
+        Batch-fetch tracks by id in one round-trip.
+        Missing ids are simply absent from the returned mapping.
+        """
+        raise NotImplementedError
+
     async def upsert(self, data: TrackUpsert) -> Track:
         raise NotImplementedError
 
@@ -113,5 +120,11 @@ class QueueRepository:
     async def preview(self, *, guild_id: int, limit: int) -> list[QueueItem]:
         raise NotImplementedError
 
+    async def preview_with_tracks(self, *, guild_id: int, limit: int) -> list[tuple[QueueItem, Track]]:
+        """
+        Preview queued items joined with their tracks in one round-trip.
+        """
+        raise NotImplementedError
+
     async def clear(self, *, guild_id: int) -> None:
         raise NotImplementedError
@@ -0,0 +1,33 @@
+# packages/core/jukebotx_core/use_cases/list_queue.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from jukebotx_core.ports.repositories import QueueItem, QueueRepository, Track
+
+
+@dataclass(frozen=True)
+class QueueEntry:
+    item: QueueItem
+    track: Track
+
+
+@dataclass(frozen=True)
+class ListQueueResult:
+    entries: list[QueueEntry]
+
+
+class ListQueue:
+    """
+    Return upcoming queue items for a guild together with their tracks.
+
+    Uses the joined repository query so a preview of N items costs one
+    round-trip instead of 1 + N.
+    """
+
+    def __init__(self, *, queue_repo: QueueRepository) -> None:
+        self._queue_repo = queue_repo
+
+    async def execute(self, *, guild_id: int, limit: int = 5) -> ListQueueResult:
+        pairs = await self._queue_repo.preview_with_tracks(guild_id=guild_id, limit=limit)
+        return ListQueueResult(entries=[QueueEntry(item=item, track=track) for item, track in pairs])
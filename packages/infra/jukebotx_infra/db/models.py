@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID as PyUUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func, BigInteger
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, func, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -36,7 +36,7 @@ class SubmissionModel(Base):
     __tablename__ = "submissions"
 
     id: Mapped[PyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    track_id: Mapped[PyUUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tracks.id"), nullable=False)
+    track_id: Mapped[PyUUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tracks.id"), index=True, nullable=False)
     guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
     channel_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     message_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -48,15 +48,23 @@ class QueueItemModel(Base):
     """Database model for a queued track in a guild."""
 
     __tablename__ = "queue_items"
+    __table_args__ = (
+        # Serves the queue-drain pattern: WHERE guild_id=? AND status='queued'
+        # ORDER BY position LIMIT n — one index range scan, no sort.
+        Index("ix_queue_items_guild_status_pos", "guild_id", "status", "position"),
+    )
 
     id: Mapped[PyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    guild_id: Mapped[int] = mapped_column(BigInteger, index=True, nullable=False)
-    track_id: Mapped[PyUUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tracks.id"), nullable=False)
+    guild_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    track_id: Mapped[PyUUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tracks.id"), index=True, nullable=False)
 
     # Discord user snowflake -> MUST be BigInteger
     requested_by: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
-    status: Mapped[str] = mapped_column(String(32), index=True, nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum("queued", "playing", "played", "skipped", name="queue_item_status"),
+        nullable=False,
+    )
     position: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
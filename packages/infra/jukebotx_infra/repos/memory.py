@@ -37,6 +37,9 @@ class InMemoryTrackRepository(TrackRepository):
             raise KeyError(f"Track not found: {track_id}")
         return t
 
+    async def get_by_ids(self, track_ids: list[UUID]) -> dict[UUID, Track]:
+        return {tid: self._by_id[tid] for tid in track_ids if tid in self._by_id}
+
     async def upsert(self, data: TrackUpsert) -> Track:
         existing = await self.get_by_suno_url(data.suno_url)
         now = _now()
@@ -101,8 +104,9 @@ class InMemorySubmissionRepository(SubmissionRepository):
 
 
 class InMemoryQueueRepository(QueueRepository):
-    def __init__(self) -> None:
+    def __init__(self, track_repo: InMemoryTrackRepository | None = None) -> None:
         self._by_guild: dict[int, list[QueueItem]] = {}
+        self._track_repo = track_repo
 
     async def enqueue(self, data: QueueItemCreate) -> QueueItem:
         now = _now()
@@ -142,5 +146,11 @@ class InMemoryQueueRepository(QueueRepository):
         queued = [qi for qi in items if qi.status == "queued"]
         return queued[:limit]
 
+    async def preview_with_tracks(self, *, guild_id: int, limit: int) -> list[tuple[QueueItem, Track]]:
+        if self._track_repo is None:
+            raise NotImplementedError("preview_with_tracks requires a track repository")
+        items = await self.preview(guild_id=guild_id, limit=limit)
+        return [(qi, await self._track_repo.get_by_id(qi.track_id)) for qi in items]
+
     async def clear(self, *, guild_id: int) -> None:
         self._by_guild[guild_id] = []
@@ -6,8 +6,9 @@ from uuid import UUID
 from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from jukebotx_core.ports.repositories import QueueItem, QueueItemCreate, QueueRepository
-from jukebotx_infra.db.models import QueueItemModel
+from jukebotx_core.ports.repositories import QueueItem, QueueItemCreate, QueueRepository, Track
+from jukebotx_infra.db.models import QueueItemModel, TrackModel
+from jukebotx_infra.repos.track_repo import _to_domain as _track_to_domain
 
 
 def _now() -> datetime:
@@ -92,6 +93,18 @@ class PostgresQueueRepository(QueueRepository):
             )
             return [_to_domain(item) for item in rows]
 
+    async def preview_with_tracks(self, *, guild_id: int, limit: int) -> list[tuple[QueueItem, Track]]:
+        """Return queued items joined with their tracks in a single query."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(QueueItemModel, TrackModel)
+                .join(TrackModel, TrackModel.id == QueueItemModel.track_id)
+                .where(QueueItemModel.guild_id == guild_id, QueueItemModel.status == "queued")
+                .order_by(QueueItemModel.position.asc())
+                .limit(limit)
+            )
+            return [(_to_domain(item), _track_to_domain(track)) for item, track in result.all()]
+
     async def clear(self, *, guild_id: int) -> None:
         """Clear all queued items for a guild."""
         async with self._session_factory() as session:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 from uuid import UUID
 
@@ -32,12 +33,39 @@ def _to_domain(track: TrackModel) -> Track:
     )
 
 
+_CACHE_TTL_SECONDS = 60.0
+_CACHE_MAX_ENTRIES = 10_000
+
+
 class PostgresTrackRepository(TrackRepository):
-    """Postgres-backed repository for tracks."""
+    """Postgres-backed repository for tracks.
+
+    Lookups by id are served from a short-TTL in-process cache: track rows
+    change rarely (only via upsert, which refreshes the entry), while queue
+    and playback paths re-read them constantly.
+    """
 
     def __init__(self, session_factory: async_sessionmaker) -> None:
         """Initialize the repository with an async session factory."""
         self._session_factory = session_factory
+        self._cache: dict[UUID, tuple[float, Track]] = {}
+
+    def _cache_get(self, track_id: UUID) -> Track | None:
+        """Return a cached track if present and not expired."""
+        entry = self._cache.get(track_id)
+        if entry is None:
+            return None
+        expires_at, track = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[track_id]
+            return None
+        return track
+
+    def _cache_put(self, track: Track) -> None:
+        """Cache a track, keeping the cache bounded."""
+        if len(self._cache) >= _CACHE_MAX_ENTRIES:
+            self._cache.clear()
+        self._cache[track.id] = (time.monotonic() + _CACHE_TTL_SECONDS, track)
 
     async def get_by_suno_url(self, suno_url: str) -> Track | None:
         """Fetch a track by its Suno URL."""
@@ -62,7 +90,9 @@ class PostgresTrackRepository(TrackRepository):
                 existing.updated_at = now
                 await session.commit()
                 await session.refresh(existing)
-                return _to_domain(existing)
+                track = _to_domain(existing)
+                self._cache_put(track)
+                return track
 
             created = TrackModel(
                 suno_url=data.suno_url,
@@ -79,12 +109,42 @@ class PostgresTrackRepository(TrackRepository):
             session.add(created)
             await session.commit()
             await session.refresh(created)
-            return _to_domain(created)
+            track = _to_domain(created)
+            self._cache_put(track)
+            return track
 
     async def get_by_id(self, track_id: UUID) -> Track:
         """Fetch a track by its UUID."""
+        cached = self._cache_get(track_id)
+        if cached is not None:
+            return cached
         async with self._session_factory() as session:
             result = await session.get(TrackModel, track_id)
             if result is None:
                 raise KeyError(f"Track not found: {track_id}")
-            return _to_domain(result)
+            track = _to_domain(result)
+            self._cache_put(track)
+            return track
+
+    async def get_by_ids(self, track_ids: list[UUID]) -> dict[UUID, Track]:
+        """Fetch multiple tracks in a single query, keyed by UUID."""
+        if not track_ids:
+            return {}
+        found: dict[UUID, Track] = {}
+        missing: list[UUID] = []
+        # Queue entries frequently repeat a track; dedupe so the IN-list only
+        # carries distinct ids.
+        for track_id in dict.fromkeys(track_ids):
+            cached = self._cache_get(track_id)
+            if cached is not None:
+                found[track_id] = cached
+            else:
+                missing.append(track_id)
+        if missing:
+            async with self._session_factory() as session:
+                rows = await session.scalars(select(TrackModel).where(TrackModel.id.in_(missing)))
+                for row in rows:
+                    track = _to_domain(row)
+                    self._cache_put(track)
+                    found[track.id] = track
+        return found
@@ -280,6 +280,24 @@ class HttpxSunoClient:
             "Referer": "https://suno.com/",
         }
         self._max_attempts = max(1, max_attempts)
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                headers=self._headers,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client. Safe to call when no client was created."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
     @staticmethod
     def _format_http_error(exc: httpx.HTTPStatusError, normalized_url: str) -> str:
@@ -311,68 +329,63 @@ class HttpxSunoClient:
         page_html: str | None = None
         final_url = normalized_url
 
-        async with httpx.AsyncClient(
-            timeout=self._timeout,
-            headers=self._headers,
-            follow_redirects=True,
-            http2=True,
-        ) as client:
-            last_exc: BaseException | None = None
-            for attempt in range(1, self._max_attempts + 1):
-                try:
-                    resp = await client.get(normalized_url)
-                    if resp.status_code in retryable_statuses:
-                        snippet = resp.text[:300].replace("\n", " ").strip()
-                        raise SunoScrapeError(
-                            "Retryable Suno response. "
-                            f"Status: {resp.status_code}. URL: {resp.url}. "
-                            f"Body snippet: {snippet!r}"
-                        )
-
-                    try:
-                        resp.raise_for_status()
-                    except httpx.HTTPStatusError as exc:
-                        raise SunoScrapeError(self._format_http_error(exc, normalized_url)) from exc
-
-                    page_html = resp.text
-                    final_url = str(resp.url)
-                    last_exc = None
-                    break
-                except (httpx.ReadTimeout, httpx.ConnectTimeout) as exc:
-                    last_exc = exc
-                    _LOG.warning(
-                        "Timeout fetching Suno page (attempt %d/%d): %s exc_repr=%r",
-                        attempt,
-                        self._max_attempts,
-                        normalized_url,
-                        exc,
-                    )
-                except httpx.RequestError as exc:
-                    last_exc = exc
-                    _LOG.warning(
-                        "Request error fetching Suno page (attempt %d/%d): %s exc_type=%s exc_repr=%r",
-                        attempt,
-                        self._max_attempts,
-                        normalized_url,
-                        type(exc).__name__,
-                        exc,
-                    )
-                except SunoScrapeError as exc:
-                    last_exc = exc
-                    if attempt == self._max_attempts:
-                        break
-                    _LOG.warning(
-                        "Retrying Suno fetch (attempt %d/%d): %s",
-                        attempt,
-                        self._max_attempts,
-                        exc,
+        client = self._get_client()
+        last_exc: BaseException | None = None
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                resp = await client.get(normalized_url)
+                if resp.status_code in retryable_statuses:
+                    snippet = resp.text[:300].replace("\n", " ").strip()
+                    raise SunoScrapeError(
+                        "Retryable Suno response. "
+                        f"Status: {resp.status_code}. URL: {resp.url}. "
+                        f"Body snippet: {snippet!r}"
                     )
 
-                if attempt < self._max_attempts:
-                    await asyncio.sleep((0.6 * (2 ** (attempt - 1))) + random.random() * 0.3)
+                try:
+                    resp.raise_for_status()
+                except httpx.HTTPStatusError as exc:
+                    raise SunoScrapeError(self._format_http_error(exc, normalized_url)) from exc
 
-            else:
+                page_html = resp.text
+                final_url = str(resp.url)
                 last_exc = None
+                break
+            except (httpx.ReadTimeout, httpx.ConnectTimeout) as exc:
+                last_exc = exc
+                _LOG.warning(
+                    "Timeout fetching Suno page (attempt %d/%d): %s exc_repr=%r",
+                    attempt,
+                    self._max_attempts,
+                    normalized_url,
+                    exc,
+                )
+            except httpx.RequestError as exc:
+                last_exc = exc
+                _LOG.warning(
+                    "Request error fetching Suno page (attempt %d/%d): %s exc_type=%s exc_repr=%r",
+                    attempt,
+                    self._max_attempts,
+                    normalized_url,
+                    type(exc).__name__,
+                    exc,
+                )
+            except SunoScrapeError as exc:
+                last_exc = exc
+                if attempt == self._max_attempts:
+                    break
+                _LOG.warning(
+                    "Retrying Suno fetch (attempt %d/%d): %s",
+                    attempt,
+                    self._max_attempts,
+                    exc,
+                )
+
+            if attempt < self._max_attempts:
+                await asyncio.sleep((0.6 * (2 ** (attempt - 1))) + random.random() * 0.3)
+
+        else:
+            last_exc = None
 
         if page_html is None and last_exc is not None:
             raise SunoScrapeError(
@@ -189,6 +189,23 @@ class HttpxSunoPlaylistClient:
     ) -> None:
         self._timeout = httpx.Timeout(timeout_seconds)
         self._headers = {"User-Agent": user_agent}
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                headers=self._headers,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client. Safe to call when no client was created."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
     async def fetch_playlist(self, playlist_url: str) -> SunoPlaylistData:
         """
@@ -204,14 +221,10 @@ class HttpxSunoPlaylistClient:
             SunoScrapeError: on network errors / non-200 responses.
         """
         try:
-            async with httpx.AsyncClient(
-                timeout=self._timeout,
-                headers=self._headers,
-                follow_redirects=True,
-            ) as client:
-                resp = await client.get(playlist_url)
-                resp.raise_for_status()
-                page_html = resp.text
+            client = self._get_client()
+            resp = await client.get(playlist_url)
+            resp.raise_for_status()
+            page_html = resp.text
         except Exception as exc:
             raise SunoScrapeError(
                 f"Failed to fetch Suno playlist page: {playlist_url}. Error: {exc}"
@@ -47,7 +47,7 @@ class FakeProcess:
         return 0
 
 
-class FakeFFmpegPCMAudio:
+class FakeFFmpegOpusAudio:
     def __init__(self, url: str, *, before_options: str, options: str, stderr) -> None:
         self.url = url
         self.before_options = before_options
@@ -55,12 +55,17 @@ class FakeFFmpegPCMAudio:
         self.process = FakeProcess(raise_timeout=True)
         self.cleanup_called = False
 
+    @classmethod
+    async def from_probe(cls, url: str, *, method=None, before_options=None, options=None, stderr=None):
+        return cls(url, before_options=before_options, options=options, stderr=stderr)
+
     def cleanup(self) -> None:
         self.cleanup_called = True
 
 
 class FakeVoiceClient:
     def __init__(self) -> None:
+        self.guild = None
         self._playing = False
         self._paused = False
         self.stop_called = False
@@ -84,11 +89,19 @@ class FakeVoiceClient:
 
 @pytest.mark.asyncio
 async def test_play_next_starts_track(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(discord, "FFmpegPCMAudio", FakeFFmpegPCMAudio)
+    monkeypatch.setattr(discord, "FFmpegOpusAudio", FakeFFmpegOpusAudio)
 
     session = SessionState()
     session.queue.append(
-        Track(url="https://example.com/track1", title="Track 1", requester_id=1, requester_name="User")
+        Track(
+            audio_url="https://cdn1.suno.ai/track1.mp3",
+            page_url=None,
+            title="Track 1",
+            artist_display=None,
+            media_url=None,
+            requester_id=1,
+            requester_name="User",
+        )
     )
     controller = GuildAudioController(guild_id=123, session=session)
     voice_client = FakeVoiceClient()
@@ -103,11 +116,19 @@ async def test_play_next_starts_track(monkeypatch: pytest.MonkeyPatch) -> None:
 
 @pytest.mark.asyncio
 async def test_stop_cleans_up_ffmpeg(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(discord, "FFmpegPCMAudio", FakeFFmpegPCMAudio)
+    monkeypatch.setattr(discord, "FFmpegOpusAudio", FakeFFmpegOpusAudio)
 
     session = SessionState()
     session.queue.append(
-        Track(url="https://example.com/track1", title="Track 1", requester_id=1, requester_name="User")
+        Track(
+            audio_url="https://cdn1.suno.ai/track1.mp3",
+            page_url=None,
+            title="Track 1",
+            artist_display=None,
+            media_url=None,
+            requester_id=1,
+            requester_name="User",
+        )
     )
     controller = GuildAudioController(guild_id=123, session=session)
     voice_client = FakeVoiceClient()
@@ -127,15 +148,31 @@ async def test_stop_cleans_up_ffmpeg(monkeypatch: pytest.MonkeyPatch) -> None:
 
 @pytest.mark.asyncio
 async def test_track_end_autoplays_next(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(discord, "FFmpegPCMAudio", FakeFFmpegPCMAudio)
+    monkeypatch.setattr(discord, "FFmpegOpusAudio", FakeFFmpegOpusAudio)
 
     session = SessionState()
     session.autoplay_enabled = True
     session.queue.append(
-        Track(url="https://example.com/track1", title="Track 1", requester_id=1, requester_name="User")
+        Track(
+            audio_url="https://cdn1.suno.ai/track1.mp3",
+            page_url=None,
+            title="Track 1",
+            artist_display=None,
+            media_url=None,
+            requester_id=1,
+            requester_name="User",
+        )
     )
     session.queue.append(
-        Track(url="https://example.com/track2", title="Track 2", requester_id=2, requester_name="User2")
+        Track(
+            audio_url="https://cdn1.suno.ai/track2.mp3",
+            page_url=None,
+            title="Track 2",
+            artist_display=None,
+            media_url=None,
+            requester_id=2,
+            requester_name="User2",
+        )
     )
     controller = GuildAudioController(guild_id=123, session=session)
     voice_client = FakeVoiceClient()
@@ -0,0 +1,62 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.extend(
+    [
+        str(ROOT / "apps" / "bot"),
+        str(ROOT / "packages" / "core"),
+        str(ROOT / "packages" / "infra"),
+    ]
+)
+
+from jukebotx_core.ports.repositories import QueueItemCreate, TrackUpsert
+from jukebotx_core.use_cases.list_queue import ListQueue
+from jukebotx_infra.repos.memory import InMemoryQueueRepository, InMemoryTrackRepository
+
+
+def _upsert_data(suno_url: str, title: str) -> TrackUpsert:
+    return TrackUpsert(
+        suno_url=suno_url,
+        title=title,
+        artist_display=None,
+        artist_username=None,
+        lyrics=None,
+        image_url=None,
+        video_url=None,
+        mp3_url=f"{suno_url}.mp3",
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_queue_returns_items_with_tracks() -> None:
+    track_repo = InMemoryTrackRepository()
+    queue_repo = InMemoryQueueRepository(track_repo=track_repo)
+
+    first = await track_repo.upsert(_upsert_data("https://suno.com/song/one", "One"))
+    second = await track_repo.upsert(_upsert_data("https://suno.com/song/two", "Two"))
+    await queue_repo.enqueue(QueueItemCreate(guild_id=1, track_id=first.id, requested_by=11))
+    await queue_repo.enqueue(QueueItemCreate(guild_id=1, track_id=second.id, requested_by=22))
+
+    result = await ListQueue(queue_repo=queue_repo).execute(guild_id=1)
+
+    assert [entry.track.title for entry in result.entries] == ["One", "Two"]
+    assert [entry.item.position for entry in result.entries] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_list_queue_respects_limit_and_guild_scope() -> None:
+    track_repo = InMemoryTrackRepository()
+    queue_repo = InMemoryQueueRepository(track_repo=track_repo)
+
+    track = await track_repo.upsert(_upsert_data("https://suno.com/song/one", "One"))
+    await queue_repo.enqueue(QueueItemCreate(guild_id=1, track_id=track.id, requested_by=11))
+    await queue_repo.enqueue(QueueItemCreate(guild_id=1, track_id=track.id, requested_by=22))
+
+    result = await ListQueue(queue_repo=queue_repo).execute(guild_id=1, limit=1)
+    assert len(result.entries) == 1
+
+    other_guild = await ListQueue(queue_repo=queue_repo).execute(guild_id=2)
+    assert other_guild.entries == []